@@ -1,6 +1,8 @@
+import sys
+import inspect
 from pathlib import Path
 from tqdm import tqdm
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from promptify.prompter.conversation_logger import *
 from promptify.utils.data_utils import *
 from promptify.prompter.prompt_cache import PromptCache
@@ -20,16 +22,21 @@ class Pipeline:
         self.conversation_path = kwargs.get("output_path", Path.cwd())
         self.structured_output = structured_output
 
-        self.model_args_count = self.model.run.__code__.co_argcount
-        self.model_variables = self.model.run.__code__.co_varnames[
-            1 : self.model_args_count
+        # inspect.signature follows __wrapped__, so decorated run methods report their real arguments.
+        model_args = [
+            parameter.name
+            for parameter in inspect.signature(self.model.run).parameters.values()
+            if parameter.kind
+            in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
         ]
+        self.model_args_count = len(model_args) + 1
+        self.model_variables = frozenset(model_args)
 
-        self.conversation_path = os.getcwd()
+        self.conversation_path = sys.intern(os.getcwd())
         self.model_dict = {
             key: value
-            for key, value in model.__dict__.items()
-            if is_string_or_digit(value)
+            for key, value in vars(model).items()
+            if not key.startswith("_") and isinstance(value, (str, int, float, bool))
         }
         self.logger = ConversationLogger(self.conversation_path, self.model_dict)
 
@@ -55,29 +62,108 @@ class Pipeline:
             if output is None:
                 return None
 
-            if "jinja" in prompter.template:
-                prompt_name = prompter.template
-            else:
-                prompt_name = "Unknown"
-
-            if self.structured_output:
-                message = create_message(
-                    template,
-                    variables_dict,
-                    output["text"],
-                    output["parsed"]["data"]["completion"],
-                    prompt_name,
-                )
-            else:
-                message = create_message(
-                    template, variables_dict, output, None, prompt_name
-                )
-
-            self.logger.add_message(message)
+            self._log_output(prompter, template, variables_dict, output)
             outputs_list.append(output)
 
         return outputs_list
 
+    def fit_many(self, text_inputs: List[str], **kwargs) -> Optional[List[List[Any]]]:
+        """
+        Processes several input texts through the pipeline. All prompts for a prompter are generated
+        up front, and each distinct prompt is sent to the model only once, so duplicated inputs and
+        cached prompts do not trigger extra model calls. Models whose run() takes a `prompts` list
+        receive all uncached prompts in one call.
+
+        Returns a list with, for each input text, the same output list that `fit` would return.
+        """
+
+        outputs_lists = [[] for _ in text_inputs]
+        for prompter in tqdm(self.prompters):
+            try:
+                generated = [
+                    prompter.generate(text_input, self.model.model, **kwargs)
+                    for text_input in text_inputs
+                ]
+            except ValueError as e:
+                print(f"Error in generating prompt: {e}")
+                return None
+
+            outputs = {}
+            pending = []
+            for template in dict.fromkeys(template for template, _ in generated):
+                if kwargs.get("verbose", False):
+                    print(template)
+
+                output = self.prompt_cache.get(template) if self.cache_prompt else None
+                if output is None:
+                    pending.append(template)
+                else:
+                    outputs[template] = output
+
+            if pending and "prompts" in self.model_variables:
+                # Models whose run() accepts a list of prompts get them in a single call.
+                try:
+                    responses = self.model.execute_with_retry(prompts=pending)
+                except Exception as e:
+                    print(f"Error in model execution: {e}")
+                    return None
+
+                if not isinstance(responses, list) or len(responses) != len(pending):
+                    print(
+                        f"Error in model execution: expected a list of {len(pending)} responses, got {responses!r}"
+                    )
+                    return None
+
+                for template, response in zip(pending, responses):
+                    outputs[template] = self._process_response(template, response)
+            else:
+                for template in pending:
+                    output = self._get_output_from_cache_or_model(template)
+                    if output is None:
+                        return None
+                    outputs[template] = output
+
+            for outputs_list, (template, variables_dict) in zip(outputs_lists, generated):
+                self._log_output(prompter, template, variables_dict, outputs[template])
+                outputs_list.append(outputs[template])
+
+        return outputs_lists
+
+    def close(self):
+        """
+        Writes the full conversation history to disk and closes the conversation log.
+        """
+
+        self.logger.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _log_output(self, prompter, template, variables_dict, output):
+        if "jinja" in prompter.template:
+            prompt_name = prompter.template
+        else:
+            prompt_name = "Unknown"
+
+        # Models such as HubModel return plain generations rather than parsed dicts.
+        if self.structured_output and isinstance(output, dict):
+            message = create_message(
+                template,
+                variables_dict,
+                output["text"],
+                output["parsed"]["data"]["completion"],
+                prompt_name,
+            )
+        else:
+            message = create_message(
+                template, variables_dict, output, None, prompt_name
+            )
+
+        self.logger.add_message(message)
+
     def _get_output_from_cache_or_model(self, template):
         output = None
 
@@ -91,14 +177,19 @@ class Pipeline:
                 print(f"Error in model execution: {e}")
                 return None
 
-            if self.structured_output:
-                output = self.model.model_output(
-                    response, json_depth_limit=self.json_depth_limit
-                )
-            else:
-                output = response
+            output = self._process_response(template, response)
 
-            if self.cache_prompt:
-                self.prompt_cache.add(template, output)
+        return output
+
+    def _process_response(self, template, response):
+        if self.structured_output:
+            output = self.model.model_output(
+                response, json_depth_limit=self.json_depth_limit
+            )
+        else:
+            output = response
+
+        if self.cache_prompt:
+            self.prompt_cache.add(template, output)
 
         return output
@@ -1,8 +1,15 @@
+import os
+import weakref
 from promptify.utils.file_utils import *
 from promptify.utils.conversation_utils import *
 from promptify.utils.data_utils import *
 
 
+def _close_history(history_fp, conversation_path: str, conversation: Dict[str, Any]):
+    write_json(conversation_path, conversation, "history")
+    history_fp.close()
+
+
 class ConversationLogger:
     def __init__(self, conversation_path: str, llm_parameters: Dict):
         """Create a logger for a conversation.
@@ -15,13 +22,49 @@ class ConversationLogger:
         self.conversation_id = str(uuid.uuid4())
         self.storage_name = f"llm_responses/llm_session_{self.conversation_id}/"
         self.conversation_path = os.path.join(conversation_path, self.storage_name)
-        Path(self.conversation_path).mkdir(parents=True, exist_ok=True)
         self.llm_parameters = llm_parameters
         self.model_dict = {
             key: value
             for key, value in self.llm_parameters.items()
             if is_string_or_digit(value)
         }
+        self.conversation = None
+        self._history_fp = None
+        self._finalizer = None
+
+    def _ensure_history(self):
+        """Create the conversation folder, schema and history log on first use.
+
+        The first line of history.jsonl holds the conversation schema without its messages,
+        every following line holds one message.
+        """
+
+        if self._history_fp is not None:
+            return
+
+        Path(self.conversation_path).mkdir(parents=True, exist_ok=True)
+        new_conversation = self.conversation is None
+        if new_conversation:
+            self.conversation = get_conversation_schema(
+                self.conversation_id, self.llm_parameters["model"], **self.llm_parameters
+            )
+        self._history_fp = open(
+            os.path.join(self.conversation_path, "history.jsonl"),
+            "a",
+            buffering=1,
+            encoding="utf-8",
+        )
+        if new_conversation:
+            self._history_fp.write(
+                json_line(
+                    {key: value for key, value in self.conversation.items() if key != "messages"}
+                )
+            )
+        # Write history.json and close the log even if close() is never called,
+        # at the latest when the logger is garbage collected or the interpreter exits.
+        self._finalizer = weakref.finalize(
+            self, _close_history, self._history_fp, self.conversation_path, self.conversation
+        )
 
     def add_message(self, message: Dict[str, Any]):
         """Add a message to the conversation.
@@ -33,12 +76,24 @@ class ConversationLogger:
             **kwargs: Additional metadata to be added to the message.
         """
 
-        self.conversation = get_conversation_schema(
-            self.conversation_id, self.llm_parameters["model"], **self.llm_parameters
-        )
-        message_id = str(uuid.uuid4())
+        self._ensure_history()
         self.conversation["messages"].append(message)
-        write_json(self.conversation_path, self.conversation, message_id)
+        self._history_fp.write(json_line(message))
+
+    def flush_history(self):
+        """Write the full conversation, including all messages so far, to history.json."""
+
+        self._ensure_history()
+        write_json(self.conversation_path, self.conversation, "history")
+
+    def close(self):
+        """Write the full conversation to disk and close the history log."""
+
+        if self._history_fp is None:
+            return
+
+        self._finalizer()
+        self._history_fp = None
 
     def __repr__(self):
         return f"ConversationLogger(conversation_id={self.conversation_id}, conversation_path={self.conversation_path})"
@@ -1,4 +1,5 @@
 import os
+import sys
 import uuid
 from glob import glob
 import datetime
@@ -6,6 +7,7 @@ from pathlib import Path
 
 from promptify.utils.data_utils import *
 from promptify.prompter.template_loader import TemplateLoader
+from promptify.prompter.prompt_cache import PromptCache
 
 from typing import List, Dict, Any, Optional
 from jinja2 import Environment, FileSystemLoader, meta, Template
@@ -18,12 +20,23 @@ class Prompter:
 
     """
 
+    __slots__ = (
+        "template",
+        "template_loader",
+        "allowed_missing_variables",
+        "default_variable_values",
+        "from_string",
+        "_prompt_key_cache",
+    )
+
     def __init__(
         self,
         template,
         from_string = False,
         allowed_missing_variables: Optional[List[str]] = None,
         default_variable_values: Optional[Dict[str, Any]] = None,
+        template_engine: str = "jinja2",
+        preload_templates: bool = False,
     ) -> None:
         """
         Initialize Prompter with default or user-specified settings.
@@ -37,23 +50,49 @@ class Prompter:
         default_variable_values : dict of str: any, optional
             A dictionary mapping variable names to default values to be used in the template.
             If a variable is not found in the input dictionary or in the default values, it will be assumed to be required and an error will be raised. Default is an empty dictionary.
+        template_engine : str, optional
+            The engine used to render templates, either 'jinja2' or 'minijinja'. MiniJinja must be installed separately. Default is 'jinja2'.
+        preload_templates : bool, optional
+            Whether to compile all built-in templates up front instead of on first use. Default is False.
         """
 
-        self.template = template
-        self.template_loader = TemplateLoader()
-        self.allowed_missing_variables = [
+        self.template = sys.intern(template) if isinstance(template, str) else template
+        self.template_loader = TemplateLoader(template_engine)
+        self.allowed_missing_variables = {
             "examples",
             "description",
             "output_format",
-        ]
-        self.allowed_missing_variables.extend(allowed_missing_variables or [])
+        }
+        self.allowed_missing_variables.update(allowed_missing_variables or [])
         self.default_variable_values = default_variable_values or {}
         self.from_string = from_string
+        self._prompt_key_cache = PromptCache()
+
+        if preload_templates:
+            self.template_loader.preload_builtin_templates()
 
 
     def update_default_variable_values(self, new_defaults: Dict[str, Any]) -> None:
         self.default_variable_values.update(new_defaults)
 
+    def _prompt_key(self, text_input, model_name, kwargs) -> Optional[tuple]:
+        """
+        Build a cache key for a prompt request, or None if any variable value is not a plain scalar.
+        The default variable values are part of the key, and so are the value types, since
+        1, 1.0 and True compare equal but render differently.
+        """
+        variables = {**self.default_variable_values, **kwargs, "text_input": text_input}
+        if not all(value is None or is_string_or_digit(value) for value in variables.values()):
+            return None
+        return (
+            model_name,
+            tuple(
+                sorted(
+                    (name, type(value).__name__, value) for name, value in variables.items()
+                )
+            ),
+        )
+
     def generate(self, text_input, model_name, **kwargs) -> str:
         """
         Generates a prompt based on a template and input variables.
@@ -71,40 +110,47 @@ class Prompter:
             The generated prompt string.
         """
 
+        key = self._prompt_key(text_input, model_name, kwargs)
+        cached = self._prompt_key_cache.get(key) if key is not None else None
+        if cached is not None:
+            prompt, variables_dict = cached
+            if kwargs.get("verbose", False):
+                print(prompt)
+            return prompt, dict(variables_dict)
+
         loader = self.template_loader.load_template(
             self.template, model_name, self.from_string
         )
 
-        kwargs["text_input"] = text_input
+        context = {**self.default_variable_values, **kwargs, "text_input": text_input}
 
-        if loader["environment"]:
-            variables = self.template_loader.get_template_variables(
-                loader["environment"], loader["template_name"]
-            )
+        if loader["static_body"] is not None:
+            prompt = loader["static_body"]
+            variables_dict = {}
+        elif loader["environment"]:
+            variables = loader["variables"]
             variables_dict = {
-                temp_variable_: kwargs.get(temp_variable_, None)
+                temp_variable_: context.get(temp_variable_, None)
                 for temp_variable_ in variables
             }
 
-            variables_missing = [
-                variable
-                for variable in variables
-                if variable not in kwargs
-                and variable not in self.allowed_missing_variables
-                and variable not in self.default_variable_values
-            ]
+            variables_missing = variables - context.keys() - self.allowed_missing_variables
 
             if variables_missing:
                 raise ValueError(
-                    f"Missing required variables in template {', '.join(variables_missing)}"
+                    f"Missing required variables in template {', '.join(sorted(variables_missing))}"
                 )
+
+            prompt = loader["template"].render(context).strip()
         else:
             variables_dict = {"data": None}
+            prompt = loader["template"].render(context).strip()
 
-        kwargs.update(self.default_variable_values)
-        prompt = loader["template"].render(**kwargs).strip()
-
-        if kwargs.get("verbose", False):
+        if context.get("verbose", False):
             print(prompt)
 
+        if key is not None:
+            # Store a copy so callers changing the returned dict cannot alter later cache hits.
+            self._prompt_key_cache.add(key, (prompt, dict(variables_dict)))
+
         return prompt, variables_dict
@@ -1,24 +1,27 @@
-from functools import lru_cache, cached_property
+from collections import OrderedDict
+
 
 class PromptCache:
     def __init__(self, cache_size: int = 200):
         self.cache_size = cache_size
-        self._cache     = lru_cache(maxsize=cache_size)(self._raw_cache)()
+        self._cache     = OrderedDict()
 
-    @cached_property
+    @property
     def cache(self):
         return self._cache
 
     def get(self, key):
-        return self.cache.get(key)
+        if key not in self.cache:
+            return None
+        self.cache.move_to_end(key)
+        return self.cache[key]
 
     def add(self, key, value):
-        if key not in self.cache:
-            self.cache[key] = value
+        if key in self.cache:
+            return
+        self.cache[key] = value
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
 
     def clear(self):
         self.cache.clear()
-
-    @staticmethod
-    def _raw_cache():
-        return {}
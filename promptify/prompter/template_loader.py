@@ -1,8 +1,88 @@
 import os
+import sys
+from functools import lru_cache
 from glob import glob
-from typing import List
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from promptify.utils.file_utils import *
-from jinja2 import Template, Environment, FileSystemLoader, meta
+from jinja2 import Template, Environment, FileSystemLoader, FileSystemBytecodeCache, meta
+
+
+@lru_cache(maxsize=None)
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Get the on-disk bytecode cache shared by all template environments, so compiled
+    templates survive across processes. Jinja2 places it in a per-user directory and
+    refuses to use it unless it is private to the current user. Returns None when no
+    safe cache directory can be created, in which case templates are compiled in memory only.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (RuntimeError, OSError):
+        return None
+
+
+_TEMPLATES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "prompts", "text2text"
+)
+_BUILTIN_TEMPLATES = {
+    f"{folder}.jinja": folder for folder in os.listdir(_TEMPLATES_DIR)
+}
+
+
+@lru_cache(maxsize=1024)
+def _analyze_template(
+    environment: Environment, template_name: str, template: Template
+) -> Tuple[FrozenSet[str], bool]:
+    """
+    Return the undeclared variables of a template and whether it includes, extends or imports
+    other templates. The compiled template is part of the key, so a template reloaded after an
+    edit is parsed again.
+    """
+    template_source, _, _ = environment.loader.get_source(environment, template_name)
+    parsed_content = environment.parse(template_source)
+    variables = frozenset(meta.find_undeclared_variables(parsed_content))
+    has_references = any(True for _ in meta.find_referenced_templates(parsed_content))
+    return variables, has_references
+
+
+TEMPLATE_ENGINES = ("jinja2", "minijinja")
+
+
+class MiniJinjaTemplate:
+    """
+    A template rendered with MiniJinja, exposing the same ``render`` interface as a Jinja2 template.
+    """
+
+    def __init__(self, environment, template_name: str = None, source: str = None):
+        """
+        Args:
+            environment (minijinja.Environment): The MiniJinja environment used for rendering.
+            template_name (str, optional): Name of the template to render through the environment's loader.
+            source (str, optional): Template source, used when the template was loaded from a string.
+        """
+        self.environment = environment
+        self.template_name = template_name
+        self.source = source
+
+    def render(self, *args, **kwargs) -> str:
+        """
+        Render the template with a context given as a dict and/or keyword arguments.
+        """
+        context = dict(*args, **kwargs)
+        if self.source is not None:
+            return self.environment.render_str(self.source, **context)
+        return self.environment.render_template(self.template_name, **context)
+
+
+def _import_minijinja():
+    try:
+        import minijinja
+    except ImportError:
+        raise ImportError(
+            "The minijinja template engine requires the minijinja package. "
+            "Install it with `pip install minijinja`."
+        )
+    return minijinja
 
 
 class TemplateLoader:
@@ -11,10 +91,27 @@ class TemplateLoader:
     listing available templates, and getting template variables.
     """
 
-    def __init__(self):
+    # Environments are shared across loaders so Jinja's template cache is reused.
+    _env_cache: Dict[str, Environment] = {}
+    _minijinja_env_cache: Dict[str, Any] = {}
+    # Parsed metadata.json contents, keyed by (template_name, template_path).
+    _metadata_files_cache: Dict[tuple, list] = {}
+    # Resolved metadata entries, keyed by (model_name, template_name, template_path).
+    _metadata_cache: Dict[tuple, dict] = {}
+
+    def __init__(self, template_engine: str = "jinja2"):
         """
         Initialize the TemplateLoader object and create an empty dictionary for loaded templates.
+
+        Args:
+            template_engine (str): Engine used to render templates, either "jinja2" or "minijinja".
+                Variables are always extracted with Jinja2. Defaults to "jinja2".
         """
+        if template_engine not in TEMPLATE_ENGINES:
+            raise ValueError(
+                f"Unsupported template engine {template_engine}. Please choose from : {list(TEMPLATE_ENGINES)}"
+            )
+        self.template_engine = template_engine
         self.loaded_templates = {}
 
     def load_template(
@@ -40,10 +137,17 @@ class TemplateLoader:
                 "template_dir": None,
                 "environment": None,
                 "template": template_instance,
+                "variables": None,
+                "static_body": None,
             }
         else:
             template_data = self._load_template_from_path(template, model_name)
 
+        if self.template_engine == "minijinja":
+            template_data["template"] = self._load_minijinja_template(
+                template, template_data, from_string
+            )
+
         self.loaded_templates[template] = template_data
         return self.loaded_templates[template]
 
@@ -57,19 +161,12 @@ class TemplateLoader:
         Returns:
             dict: Loaded template data.
         """
-        current_dir = os.path.dirname(os.path.realpath(__file__))
-        current_dir, _ = os.path.split(current_dir)
-        templates_dir = os.path.join(current_dir, "prompts", "text2text")
-        all_folders = {
-            f"{folder}.jinja": folder for folder in os.listdir(templates_dir)
-        }
-
-        if template in all_folders:
-            meta_data = self._get_metadata(template, templates_dir, model_name)
+        if template in _BUILTIN_TEMPLATES:
+            meta_data = self._get_metadata(template, _TEMPLATES_DIR, model_name)
 
             template_name = meta_data["metadata"]["file_name"]
             template_dir = meta_data["metadata"]["file_path"]
-            environment = Environment(loader=FileSystemLoader(template_dir))
+            environment = self._get_environment(template_dir, warm=True)
             template_instance = environment.get_template(template_name)
 
         else:
@@ -78,16 +175,100 @@ class TemplateLoader:
 
             template_name = custom_template_name
             template_dir = custom_template_dir
-            environment = Environment(loader=FileSystemLoader(template_dir))
+            environment = self._get_environment(template_dir)
             template_instance = environment.get_template(custom_template_name)
 
+        template_name = sys.intern(template_name)
+        template_dir = sys.intern(template_dir)
+        variables, has_references = _analyze_template(
+            environment, template_name, template_instance
+        )
+        # Templates without variables always render the same text, so render them once here.
+        # Included or inherited templates are not inspected for variables, so skip those.
+        is_static = not variables and not has_references
+
         return {
             "template_name": template_name,
             "template_dir": template_dir,
             "environment": environment,
             "template": template_instance,
+            "variables": variables,
+            "static_body": template_instance.render().strip() if is_static else None,
         }
 
+    def _get_environment(self, template_dir: str, warm: bool = False) -> Environment:
+        """
+        Get the shared Jinja2 environment for a template directory, creating it on first use.
+        Built-in template folders never change at runtime, so their environments skip the
+        modification check on each load; custom directories keep Jinja's auto reload.
+
+        Args:
+            template_dir (str): Directory containing the templates.
+            warm (bool): Whether to compile every template in the directory when the
+                environment is created. Defaults to False.
+
+        Returns:
+            Environment: The Jinja2 environment for the directory.
+        """
+        environment = self._env_cache.get(template_dir)
+        if environment is None:
+            environment = Environment(
+                loader=FileSystemLoader(template_dir),
+                cache_size=400,
+                auto_reload=os.path.dirname(template_dir) != _TEMPLATES_DIR,
+                bytecode_cache=_get_bytecode_cache(),
+            )
+            if warm:
+                for template_name in environment.list_templates(extensions=["jinja"]):
+                    environment.get_template(template_name)
+            self._env_cache[template_dir] = environment
+        return environment
+
+    def preload_builtin_templates(self):
+        """
+        Compile every built-in template ahead of time, so later loads only hit the shared environment caches.
+        """
+        for folder in _BUILTIN_TEMPLATES.values():
+            template_dir = os.path.join(_TEMPLATES_DIR, folder)
+            if os.path.isdir(template_dir):
+                self._get_environment(template_dir, warm=True)
+
+    def _load_minijinja_template(
+        self, template: str, template_data: dict, from_string: bool
+    ) -> MiniJinjaTemplate:
+        """
+        Create a MiniJinja counterpart for an already loaded Jinja2 template.
+
+        Args:
+            template (str): Template string or path to the template file.
+            template_data (dict): Loaded Jinja2 template data.
+            from_string (bool): Whether the template was loaded from a string.
+
+        Returns:
+            MiniJinjaTemplate: Template rendered with MiniJinja.
+        """
+        minijinja = _import_minijinja()
+
+        if from_string:
+            return MiniJinjaTemplate(minijinja.Environment(), source=template)
+
+        template_dir = template_data["template_dir"]
+        environment = self._minijinja_env_cache.get(template_dir)
+        if environment is None:
+
+            def load(name):
+                path = os.path.join(template_dir, name)
+                if not os.path.isfile(path):
+                    return None
+                with open(path, encoding="utf-8") as f:
+                    return f.read()
+
+            environment = minijinja.Environment(loader=load)
+            self._minijinja_env_cache[template_dir] = environment
+        elif os.path.dirname(template_dir) != _TEMPLATES_DIR:
+            # Drop MiniJinja's compiled copy so edits to custom templates are picked up.
+            environment.remove_template(template_data["template_name"])
+        return MiniJinjaTemplate(environment, template_name=template_data["template_name"])
 
     def search_model(self, data, model_name):
 
@@ -103,16 +284,24 @@ class TemplateLoader:
 
     def _get_metadata(self, template_name, template_path, model_name):
 
+        cache_key = (model_name, template_name, template_path)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         template_name, _ = template_name.split(".jinja")
-        metadata_files = glob(
-            os.path.join(template_path, template_name, "metadata.json")
-        )
+        key = (template_name, template_path)
+        if key not in self._metadata_files_cache:
+            metadata_files = glob(
+                os.path.join(template_path, template_name, "metadata.json")
+            )
+            self._metadata_files_cache[key] = read_json(metadata_files[0])
 
-        metadata = read_json(metadata_files[0])
-        metadata = self.search_model(metadata, model_name)
+        metadata = self.search_model(self._metadata_files_cache[key], model_name)
         metadata["file_path"] = os.path.join(template_path, template_name)
-    
-        return {"metadata": metadata}
+
+        self._metadata_cache[cache_key] = {"metadata": metadata}
+        return self._metadata_cache[cache_key]
 
     def _verify_template_path(self, templates_path: str):
         """
@@ -139,17 +328,35 @@ class TemplateLoader:
         """
         return environment.list_templates()
 
-    def get_template_variables(self, environment, template_name) -> List[str]:
+    def get_available_templates(self, template_path: str) -> Dict[str, str]:
         """
-        Get a list of undeclared variables for the specified template.
+        Get all template files available in the specified directory.
+
+        Args:
+            template_path (str): Directory to search for templates.
+
+        Returns:
+            Dict[str, str]: Mapping of template file names to their full paths.
+        """
+        with os.scandir(template_path) as entries:
+            return {
+                entry.name: entry.path
+                for entry in entries
+                if entry.name.endswith(".jinja") and entry.is_file(follow_symlinks=False)
+            }
+
+    def get_template_variables(self, environment, template_name) -> FrozenSet[str]:
+        """
+        Get the undeclared variables for the specified template.
 
         Args:
             environment (Environment): The Jinja2 environment of the template.
             template_name (str): The name of the template.
 
         Returns:
-            List[str]: List of undeclared variables in the template.
+            FrozenSet[str]: Undeclared variables in the template.
         """
-        template_source = environment.loader.get_source(environment, template_name)
-        parsed_content = environment.parse(template_source)
-        return list(meta.find_undeclared_variables(parsed_content))
+        variables, _ = _analyze_template(
+            environment, template_name, environment.get_template(template_name)
+        )
+        return variables
@@ -6,6 +6,11 @@ import hashlib
 import os
 import io
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def read_json(json_file):
     """
@@ -47,6 +52,23 @@ def write_json(path, data, file_name):
         raise IOError(f"Error writing JSON file '{full_path}': {e.strerror}")
 
 
+def json_line(data) -> str:
+    """
+    Serializes data as a single compact line of JSON, terminated by a newline.
+
+    Args:
+        data (Any): The data to serialize. This can be any JSON-serializable object.
+
+    Returns:
+        str: The JSON line.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        ).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
 def calculate_hash(text: str, encoding: str = "utf-8") -> str:
     """
     Calculate the hash of a text using the specified encoding.
@@ -0,0 +1,164 @@
+import json
+import os
+import pytest
+from typing import List
+from promptify import Model, Pipeline, Prompter
+
+
+class EchoModel(Model):
+    name = "echo"
+    description = "Echoes every prompt back, recording each call"
+
+    def __init__(self):
+        super().__init__("", "echo", api_wait=1, api_retry=1)
+        self.calls = []
+
+    def supported_models(self):
+        return ["echo"]
+
+    def _verify_model(self):
+        pass
+
+    def set_key(self, api_key: str):
+        self.api_key = api_key
+
+    def set_model(self, model: str):
+        self.model = model
+
+    def get_description(self):
+        return self.description
+
+    def get_endpoint(self):
+        return ""
+
+    def get_parameters(self):
+        return {}
+
+    def run(self, prompt: str):
+        self.calls.append(prompt)
+        return prompt
+
+    def model_output(self, response, json_depth_limit=None):
+        return {"text": response, "parsed": {"data": {"completion": []}}}
+
+
+class BatchEchoModel(EchoModel):
+    def run(self, prompts: List[str]):
+        self.calls.append(list(prompts))
+        return list(prompts)
+
+
+class HubResponse:
+    def __init__(self, prompt):
+        self.prompt = prompt
+
+    def json(self):
+        return [{"generated_text": f"{self.prompt}!"}]
+
+
+class HubLikeModel(EchoModel):
+    """Mirrors HubModel: run() takes a prompt list, model_output() returns generated texts."""
+
+    def run(self, prompts: List[str]):
+        self.calls.append(list(prompts))
+        return [HubResponse(prompt) for prompt in prompts]
+
+    def model_output(self, response, json_depth_limit=None):
+        return [item["generated_text"] for item in response.json()]
+
+
+class DictReturningModel(EchoModel):
+    """Mirrors MockModel: run() takes a prompt list but returns a single dict."""
+
+    def run(self, prompts: List[str]):
+        self.calls.append(list(prompts))
+        return {"text": "response", "parsed": {"data": {"completion": []}}}
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def prompter():
+    return Prompter("Say {{ text_input }}", from_string=True)
+
+
+def test_fit_many_keeps_input_order(prompter):
+    with Pipeline(prompter, EchoModel()) as pipeline:
+        outputs = pipeline.fit_many(["a", "b", "c"])
+    assert [output[0]["text"] for output in outputs] == ["Say a", "Say b", "Say c"]
+
+
+def test_fit_many_calls_model_once_per_distinct_prompt(prompter):
+    model = EchoModel()
+    with Pipeline(prompter, model) as pipeline:
+        outputs = pipeline.fit_many(["a", "b", "a"])
+    assert model.calls == ["Say a", "Say b"]
+    assert [output[0]["text"] for output in outputs] == ["Say a", "Say b", "Say a"]
+
+
+def test_fit_many_reuses_cached_prompts(prompter):
+    model = EchoModel()
+    with Pipeline(prompter, model) as pipeline:
+        pipeline.fit("a")
+        pipeline.fit_many(["a", "b"])
+    assert model.calls == ["Say a", "Say b"]
+
+
+def test_fit_many_batches_prompts_for_list_models(prompter):
+    model = BatchEchoModel()
+    with Pipeline(prompter, model) as pipeline:
+        outputs = pipeline.fit_many(["a", "b", "a"])
+    assert model.calls == [["Say a", "Say b"]]
+    assert [output[0]["text"] for output in outputs] == ["Say a", "Say b", "Say a"]
+
+
+def test_fit_many_missing_variable_returns_none(workdir):
+    template_path = workdir / "domain.jinja"
+    template_path.write_text("{{ domain }}: {{ text_input }}")
+    model = EchoModel()
+    with Pipeline(Prompter(str(template_path)), model) as pipeline:
+        assert pipeline.fit_many(["a", "b"]) is None
+    assert model.calls == []
+
+
+
+def test_close_writes_history(prompter):
+    with Pipeline(prompter, EchoModel()) as pipeline:
+        pipeline.fit_many(["a", "b"])
+
+    conversation_path = pipeline.logger.conversation_path
+    with open(os.path.join(conversation_path, "history.jsonl")) as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[0]["conversation_id"] == pipeline.logger.conversation_id
+    assert [line["response_text"] for line in lines[1:]] == ["Say a", "Say b"]
+
+    with open(os.path.join(conversation_path, "history.json")) as f:
+        history = json.load(f)
+    assert len(history["messages"]) == 2
+
+
+def test_prompt_cache_is_bounded(prompter):
+    model = EchoModel()
+    with Pipeline(prompter, model, cache_size=1) as pipeline:
+        pipeline.fit("a")
+        pipeline.fit("b")
+        pipeline.fit("a")
+    assert model.calls == ["Say a", "Say b", "Say a"]
+
+
+def test_fit_many_with_hub_like_model(prompter):
+    model = HubLikeModel()
+    with Pipeline(prompter, model) as pipeline:
+        outputs = pipeline.fit_many(["a", "b", "a"])
+    assert model.calls == [["Say a", "Say b"]]
+    assert outputs == [[["Say a!"]], [["Say b!"]], [["Say a!"]]]
+
+
+@pytest.mark.parametrize("text_inputs", [["a", "b"], ["a", "b", "c"]])
+def test_fit_many_rejects_mismatched_batch_responses(prompter, text_inputs):
+    with Pipeline(prompter, DictReturningModel()) as pipeline:
+        assert pipeline.fit_many(text_inputs) is None
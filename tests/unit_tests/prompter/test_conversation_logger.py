@@ -0,0 +1,63 @@
+import gc
+import json
+import os
+from promptify import ConversationLogger
+
+
+def read_history(conversation_path):
+    with open(os.path.join(conversation_path, "history.jsonl")) as f:
+        lines = [json.loads(line) for line in f]
+    with open(os.path.join(conversation_path, "history.json")) as f:
+        history = json.load(f)
+    return lines, history
+
+
+def test_history_log_and_flush(tmp_path):
+    logger = ConversationLogger(str(tmp_path), {"model": "echo", "api_key": "secret"})
+    logger.add_message({"response_text": "first"})
+    logger.add_message({"response_text": "second"})
+    logger.close()
+
+    lines, history = read_history(logger.conversation_path)
+    assert lines[0]["conversation_id"] == logger.conversation_id
+    assert "api_key" not in lines[0]["llm"]["meta_data"]
+    assert lines[1:] == [{"response_text": "first"}, {"response_text": "second"}]
+    assert history["messages"] == lines[1:]
+
+
+def test_messages_after_close_reuse_conversation(tmp_path):
+    logger = ConversationLogger(str(tmp_path), {"model": "echo"})
+    logger.add_message({"response_text": "first"})
+    logger.close()
+    logger.add_message({"response_text": "second"})
+    logger.close()
+
+    lines, history = read_history(logger.conversation_path)
+    assert len(lines) == 3
+    assert len(history["messages"]) == 2
+
+
+def test_history_written_when_logger_is_collected(tmp_path):
+    logger = ConversationLogger(str(tmp_path), {"model": "echo"})
+    logger.add_message({"response_text": "first"})
+    conversation_path = logger.conversation_path
+    del logger
+    gc.collect()
+
+    _, history = read_history(conversation_path)
+    assert history["messages"] == [{"response_text": "first"}]
+
+
+def test_folder_created_on_first_message(tmp_path):
+    logger = ConversationLogger(str(tmp_path), {"model": "echo"})
+    assert not os.path.exists(logger.conversation_path)
+
+    logger.add_message({"response_text": "first"})
+    assert os.path.isfile(os.path.join(logger.conversation_path, "history.jsonl"))
+    logger.close()
+
+
+def test_close_without_messages(tmp_path):
+    logger = ConversationLogger(str(tmp_path), {"model": "echo"})
+    logger.close()
+    assert not os.path.exists(logger.conversation_path)
@@ -0,0 +1,21 @@
+from promptify import Prompter
+
+
+def test_caller_values_override_defaults(tmp_path):
+    path = tmp_path / "template.jinja"
+    path.write_text("{{ a }} {{ text_input }}")
+    prompter = Prompter(str(path), default_variable_values={"a": "DEF"})
+
+    kwargs = {"a": "CALLER"}
+    prompt, _ = prompter.generate("x", "any-model", **kwargs)
+    assert prompt == "CALLER x"
+    assert kwargs == {"a": "CALLER"}
+    assert prompter.default_variable_values == {"a": "DEF"}
+    assert prompter.generate("x", "any-model")[0] == "DEF x"
+
+
+def test_generate_does_not_mutate_caller_kwargs():
+    prompter = Prompter("{{ a }} {{ text_input }}", from_string=True)
+    kwargs = {"a": "CALLER"}
+    prompter.generate("x", "any-model", **kwargs)
+    assert kwargs == {"a": "CALLER"}
@@ -0,0 +1,45 @@
+from promptify import Prompter, PromptCache
+
+
+def test_prompt_cache_evicts_least_recently_used():
+    cache = PromptCache(cache_size=2)
+    cache.add("a", 1)
+    cache.add("b", 2)
+    assert cache.get("a") == 1
+    cache.add("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_generate_keys_values_by_type():
+    prompter = Prompter("n={{ n }} {{ text_input }}", from_string=True)
+    prompts = [prompter.generate("x", "any-model", n=value)[0] for value in (1, 1.0, True)]
+    assert prompts == ["n=1 x", "n=1.0 x", "n=True x"]
+
+
+def test_generate_keys_on_default_values():
+    defaults = {"tone": "calm"}
+    prompter = Prompter(
+        "{{ tone }} {{ text_input }}", from_string=True, default_variable_values=defaults
+    )
+    assert prompter.generate("x", "any-model")[0] == "calm x"
+
+    defaults["tone"] = "loud"
+    assert prompter.generate("x", "any-model")[0] == "loud x"
+
+    prompter.default_variable_values["tone"] = "quiet"
+    assert prompter.generate("x", "any-model")[0] == "quiet x"
+
+
+def test_generate_cache_hits_are_isolated_from_callers(tmp_path):
+    path = tmp_path / "template.jinja"
+    path.write_text("{{ a }} {{ text_input }}")
+    prompter = Prompter(str(path))
+
+    _, variables = prompter.generate("x", "any-model", a="value")
+    variables["a"] = "changed"
+    _, variables = prompter.generate("x", "any-model", a="value")
+    assert variables == {"a": "value", "text_input": "x"}
+    variables["a"] = "changed"
+    assert prompter.generate("x", "any-model", a="value")[1]["a"] == "value"
@@ -0,0 +1,106 @@
+import os
+import pytest
+from promptify import Prompter, TemplateLoader
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    path = tmp_path / "greeting.jinja"
+    path.write_text("Hello {{ name }}, {{ text_input }}")
+    return str(path)
+
+
+def test_custom_template_edits_are_reloaded(template_path):
+    assert Prompter(template_path).generate("hi", "any-model", name="Ada")[0] == "Hello Ada, hi"
+
+    with open(template_path, "w") as f:
+        f.write("Bye {{ title }}, {{ text_input }}")
+    stat = os.stat(template_path)
+    os.utime(template_path, (stat.st_atime, stat.st_mtime + 10))
+
+    prompter = Prompter(template_path)
+    assert prompter.generate("hi", "any-model", title="Dr")[0] == "Bye Dr, hi"
+
+
+def test_builtin_environments_skip_reload():
+    loader = TemplateLoader().load_template("ner.jinja", "gpt-3.5-turbo")
+    assert loader["environment"].auto_reload is False
+
+
+def test_custom_template_edits_are_reloaded_with_minijinja(template_path):
+    pytest.importorskip("minijinja")
+    prompter = Prompter(template_path, template_engine="minijinja")
+    assert prompter.generate("hi", "any-model", name="Ada")[0] == "Hello Ada, hi"
+
+    with open(template_path, "w") as f:
+        f.write("Bye {{ name }}, {{ text_input }}")
+
+    prompter = Prompter(template_path, template_engine="minijinja")
+    assert prompter.generate("hi", "any-model", name="Ada")[0] == "Bye Ada, hi"
+
+
+def test_get_available_templates(tmp_path):
+    (tmp_path / "a.jinja").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / "folder.jinja").mkdir()
+    templates = TemplateLoader().get_available_templates(str(tmp_path))
+    assert templates == {"a.jinja": str(tmp_path / "a.jinja")}
+
+
+def test_unsupported_template_engine():
+    with pytest.raises(ValueError):
+        Prompter("{{ text_input }}", from_string=True, template_engine="mako")
+
+
+def test_minijinja_matches_jinja2(template_path):
+    pytest.importorskip("minijinja")
+    jinja_prompt, _ = Prompter(template_path).generate("hi", "any-model", name="Ada")
+    mini_prompt, _ = Prompter(template_path, template_engine="minijinja").generate(
+        "hi", "any-model", name="Ada"
+    )
+    assert mini_prompt == jinja_prompt == "Hello Ada, hi"
+
+
+def test_minijinja_from_string():
+    pytest.importorskip("minijinja")
+    prompter = Prompter("{{ x }} {{ text_input }}", from_string=True, template_engine="minijinja")
+    assert prompter.generate("hi", "any-model", x=1)[0] == "1 hi"
+
+
+def test_preload_templates(monkeypatch):
+    monkeypatch.setattr(TemplateLoader, "_env_cache", {})
+    Prompter("{{ text_input }}", from_string=True)
+    assert TemplateLoader._env_cache == {}
+
+    Prompter("{{ text_input }}", from_string=True, preload_templates=True)
+    ner_dir = os.path.join("prompts", "text2text", "ner")
+    environment = next(
+        env for path, env in TemplateLoader._env_cache.items() if path.endswith(ner_dir)
+    )
+    assert "ner_openai.jinja" in [name for _, name in environment.cache.keys()]
+
+
+def test_template_variables_loaded_with_template(template_path):
+    loader = TemplateLoader().load_template(template_path, "any-model")
+    assert loader["variables"] == frozenset({"name", "text_input"})
+
+
+def test_static_template_rendered_once(tmp_path):
+    path = tmp_path / "static.jinja"
+    path.write_text("Always the same\n")
+    loader = TemplateLoader().load_template(str(path), "any-model")
+    assert loader["static_body"] == "Always the same"
+
+    prompt, variables = Prompter(str(path)).generate("ignored", "any-model")
+    assert prompt == "Always the same"
+    assert variables == {}
+
+
+def test_template_with_include_is_not_static(tmp_path):
+    (tmp_path / "base.jinja").write_text("Input: {{ text_input }}")
+    child = tmp_path / "child.jinja"
+    child.write_text("{% include 'base.jinja' %}")
+
+    loader = TemplateLoader().load_template(str(child), "any-model")
+    assert loader["static_body"] is None
+    assert Prompter(str(child)).generate("hello", "any-model")[0] == "Input: hello"
@@ -0,0 +1,27 @@
+import json
+import pytest
+from promptify.utils import file_utils
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(file_utils, "orjson", None)
+    elif file_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_json_line(serializer):
+    line = file_utils.json_line({"text": "café", "values": [1, 2]})
+    assert line == '{"text":"café","values":[1,2]}\n'
+
+
+def test_json_line_round_trip(serializer):
+    data = {"nested": {"a": None, "b": True}, "list": ["x", 1.5]}
+    assert json.loads(file_utils.json_line(data)) == data
+
+
+def test_write_json(tmp_path):
+    file_utils.write_json(str(tmp_path), {"a": 1}, "data")
+    assert file_utils.read_json(str(tmp_path / "data.json")) == {"a": 1}